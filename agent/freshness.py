@@ -1,5 +1,7 @@
 from __future__ import annotations
+import sys
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any, Optional
 
 THRESHOLDS = {
@@ -10,35 +12,98 @@ THRESHOLDS = {
     "other": timedelta(hours=24),
 }
 
+# Thresholds as float seconds, computed once so the per-row check is a plain
+# float compare instead of timedelta arithmetic. Also passed to the graph
+# queries as $thresholds so Neo4j can decide staleness itself.
+THRESHOLDS_SECONDS = {k: v.total_seconds() for k, v in THRESHOLDS.items()}
+
+# Index-based view of the same table for the per-row path: one dict probe
+# (unknown types map to "other") plus a tuple index, instead of a .get() with
+# a second lookup for the fallback.
+_TYPE_IDX = {k: i for i, k in enumerate(THRESHOLDS_SECONDS)}
+_THR_SEC = tuple(THRESHOLDS_SECONDS.values())
+_OTHER_IDX = _TYPE_IDX["other"]
+
+# (epoch second, isoformat) of the last checked_at stamp; bursts of checks
+# landing in the same second reuse the string instead of reformatting it.
+_last_checked_at: Tuple[int, str] = (0, "")
+
+# 3.11+ fromisoformat accepts a trailing "Z" (and nanosecond fractions) in C,
+# so the string rewrite is only needed on older interpreters.
+if sys.version_info >= (3, 11):
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(dt_str: str) -> datetime:
+        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+
 def _parse_dt(dt_str: str) -> Optional[datetime]:
     if not dt_str:
         return None
     # handles "2026-01-09T01:45:54.769723+00:00" and Neo4j toString(datetime())
-    return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+    return _fromisoformat(dt_str)
 
-def freshness_check(latest_by_type: List[Dict[str, Any]]) -> Dict[str, Any]:
-    now = datetime.now(timezone.utc)
+@lru_cache(maxsize=128)
+def _parse_fetched(dt_str: Optional[str]) -> Tuple[Optional[float], Optional[str]]:
+    """
+    (epoch seconds, normalized isoformat) for a last_fetched string. Neo4j
+    hands back the same timestamps across rows and requests, so keep a small
+    cache of recent ones.
+    """
+    last = _parse_dt(dt_str)
+    if last is None:
+        return None, None
+    return last.timestamp(), last.isoformat()
+
+def _checked_at_iso(now: datetime) -> str:
+    global _last_checked_at
+    sec = int(now.timestamp())
+    if sec != _last_checked_at[0]:
+        _last_checked_at = (sec, datetime.fromtimestamp(sec, timezone.utc).isoformat())
+    return _last_checked_at[1]
+
+def freshness_check(
+    latest_by_type: List[Dict[str, Any]],
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Flag source types whose latest fetch is older than their threshold.
+
+    Rows that already carry a `stale` verdict (see get_latest_fetch_by_type
+    with thresholds) are aggregated as-is; other rows are parsed and compared.
+    Pass `now` to reuse a request-level timestamp for the comparison and
+    `checked_at` (reported at whole-second precision).
+    """
+    now = now or datetime.now(timezone.utc)
+    now_ts = now.timestamp()
     stale_types = []
     details = []
 
     for row in latest_by_type:
         stype = row.get("source_type") or "other"
-        last = _parse_dt(row.get("last_fetched"))
-        threshold = THRESHOLDS.get(stype, THRESHOLDS["other"])
+        stale = row.get("stale")
+
+        if stale is None:
+            # No verdict from the graph query; parse and compare here
+            last_ts, last_fetched = _parse_fetched(row.get("last_fetched"))
+            threshold_s = _THR_SEC[_TYPE_IDX.get(stype, _OTHER_IDX)]
+            stale = last_ts is None or (now_ts - last_ts) > threshold_s
+        else:
+            threshold_s = row["threshold_s"]
+            last_fetched = row.get("last_fetched")
 
-        if last is None or (now - last) > threshold:
+        if stale:
             stale_types.append(stype)
 
         details.append({
             "source_type": stype,
-            "last_fetched": last.isoformat() if last else None,
-            "threshold_hours": threshold.total_seconds() / 3600.0,
+            "last_fetched": last_fetched,
+            "threshold_hours": threshold_s / 3600.0,
         })
 
     return {
         "was_stale": len(stale_types) > 0,
         "stale_types": sorted(set(stale_types)),
         "details": details,
-        "checked_at": now.isoformat(),
+        "checked_at": _checked_at_iso(now),
     }
 
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import re
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
 from contextlib import asynccontextmanager
 from ingest.refresh import (
     refresh_company_period
@@ -10,8 +13,10 @@ from ingest.refresh import (
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from openai import OpenAI
+from neo4j import READ_ACCESS
 
 # Load environment variables from .env file
 load_dotenv()
@@ -19,15 +24,17 @@ load_dotenv()
 from graph.db import get_neo4j_driver
 from graph.schema import ensure_schema
 from graph.queries import (
+    COMPANY_NAME_CANDIDATES,
     find_company_by_name,
-    get_claims_with_sources,
-    get_sentiment_delta,
-    get_latest_fetch_by_type
+    get_ask_bundle,
+    list_companies,
 )
 from agent.freshness import (
+    THRESHOLDS_SECONDS,
     freshness_check
 )
 from extract.llm_entity import find_company_name_for_graph
+from extract.llm_claims import get_llm_client
 from utils.periods import get_default_periods
 from models.registry import (
     list_event_types_info,
@@ -38,7 +45,39 @@ from models.registry import (
     SignalType,
 )
 
-app = FastAPI(title="PulseGraph API", version="0.1.0")
+app = FastAPI(
+    title="PulseGraph API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
+
+# In-process TTL memo for company resolution: the company set changes rarely,
+# so repeat /ask calls skip the LLM extraction and the name lookup round-trip.
+COMPANY_CACHE_TTL_S = 300.0
+# Keys come from user input (question text, `company`), so each memo is
+# bounded: expired entries are purged when full, and it is reset if still full
+COMPANY_CACHE_MAX = 2_000
+
+_company_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_question_company_cache: Dict[str, Tuple[float, str]] = {}
+_cache_lock = threading.Lock()
+
+# Known company names and tickers compiled into alternation regexes at startup,
+# so a question that names a company outright resolves without an LLM call.
+# Maps lowercased alias -> graph company name.
+_company_aliases: Dict[str, str] = {}
+_company_pattern: Optional[Pattern[str]] = None
+_ticker_pattern: Optional[Pattern[str]] = None
+
+# Tickers that are also everyday words ("Is AI hype..."); these only count
+# when written as a cashtag, e.g. "$AI".
+_COMMON_WORD_TICKERS = frozenset({
+    "a", "ai", "all", "am", "an", "any", "are", "at", "be", "big", "by", "can",
+    "car", "cash", "ceo", "do", "eps", "fast", "for", "fun", "go", "good", "has",
+    "he", "hot", "if", "in", "is", "it", "key", "life", "low", "me", "new", "no",
+    "now", "on", "one", "or", "out", "pay", "play", "real", "run", "see", "so",
+    "to", "true", "up", "us", "we", "well", "you",
+})
 
 # -------------------------
 # Pydantic models
@@ -114,8 +153,9 @@ def on_startup() -> None:
     driver = get_neo4j_driver()
     ensure_schema(driver)
     app.state.neo4j_driver = driver
-    # Initialize OpenAI client for LLM-based entity extraction
-    app.state.openai_client = OpenAI()
+    _build_company_matcher(list_companies(driver))
+    # Shared OpenAI client (pooled transport) for LLM-based entity extraction
+    app.state.openai_client = get_llm_client()
 
 
 @app.on_event("shutdown")
@@ -125,6 +165,115 @@ def on_shutdown() -> None:
         driver.close()
 
 
+# -------------------------
+# Helpers
+# -------------------------
+
+def _cache_get(cache: Dict[str, Tuple[float, Any]], key: str) -> Optional[Any]:
+    with _cache_lock:
+        hit = cache.get(key)
+        if hit and time.monotonic() - hit[0] >= COMPANY_CACHE_TTL_S:
+            del cache[key]
+            hit = None
+    return hit[1] if hit else None
+
+
+def _cache_put(cache: Dict[str, Tuple[float, Any]], key: str, value: Any) -> None:
+    now = time.monotonic()
+    with _cache_lock:
+        if len(cache) >= COMPANY_CACHE_MAX and key not in cache:
+            for k in [k for k, (at, _) in cache.items() if now - at >= COMPANY_CACHE_TTL_S]:
+                del cache[k]
+            if len(cache) >= COMPANY_CACHE_MAX:
+                cache.clear()
+        cache[key] = (now, value)
+
+
+def _alternation(alternatives: List[str]) -> Optional[Pattern[str]]:
+    # Longest first so "Tesla Energy" wins over "Tesla"; lookarounds instead of
+    # \b so names ending in punctuation ("Meta Platforms, Inc.") still match
+    if not alternatives:
+        return None
+    alternatives.sort(key=len, reverse=True)
+    return re.compile(r"(?<!\w)(?:" + "|".join(alternatives) + r")(?!\w)")
+
+
+def _build_company_matcher(companies: Iterable[Dict[str, Any]]) -> None:
+    """
+    Compile the known company names (case-insensitive) into _company_pattern
+    and tickers (exact case, so "ON" doesn't match "on"; single letters are
+    skipped; optional "$" prefix) into _ticker_pattern.
+    """
+    global _company_aliases, _company_pattern, _ticker_pattern
+
+    aliases: Dict[str, str] = {}
+    names: List[str] = []
+    tickers: List[str] = []
+    for company in companies:
+        name = company.get("name")
+        if not name:
+            continue
+        aliases[name.lower()] = name
+        names.append(f"(?i:{re.escape(name)})")
+        ticker = company.get("ticker")
+        if ticker and len(ticker) > 1:
+            aliases.setdefault(ticker.lower(), name)
+            tickers.append(r"\$?" + re.escape(ticker))
+
+    _company_aliases = aliases
+    _company_pattern = _alternation(names)
+    _ticker_pattern = _alternation(tickers)
+
+
+def _guess_company_from_question(question: str) -> Optional[str]:
+    """
+    A company named in the question wins over a ticker; a ticker that is also
+    a common word only counts with a "$" prefix.
+    """
+    if _company_pattern is not None:
+        m = _company_pattern.search(question)
+        if m:
+            return _company_aliases.get(m.group(0).lower())
+    if _ticker_pattern is not None:
+        for m in _ticker_pattern.finditer(question):
+            token = m.group(0)
+            ticker = token.lstrip("$").lower()
+            if token.startswith("$") or ticker not in _COMMON_WORD_TICKERS:
+                return _company_aliases.get(ticker)
+    return None
+
+
+def _cached_find_company(db, name: str) -> Optional[Dict[str, Any]]:
+    """
+    find_company_by_name with a TTL memo. Misses are not cached so a company
+    seeded after startup is picked up on the next request.
+    """
+    key = name.strip().lower()
+    company = _cache_get(_company_cache, key)
+    if company is None:
+        company = find_company_by_name(db, name)
+        if company:
+            _cache_put(_company_cache, key, company)
+    return company
+
+
+def _cached_company_name_for_question(client: OpenAI, question: str) -> Optional[str]:
+    """
+    find_company_name_for_graph with a TTL memo keyed by the question text.
+    """
+    key = question.strip()
+    name = _cache_get(_question_company_cache, key)
+    if name is None:
+        name = find_company_name_for_graph(
+            client=client,
+            question=question,
+            confidence_threshold=0.5,
+        )
+        if name:
+            _cache_put(_question_company_cache, key, name)
+    return name
+
+
 # -------------------------
 # Routes
 # -------------------------
@@ -163,7 +312,9 @@ async def get_signal_types():
 
 
 @app.post("/ask", response_model=AskResponse)
-async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
+def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
+    # Plain `def`: every step below (Neo4j, OpenAI, refresh) is blocking I/O,
+    # so FastAPI runs this on its threadpool instead of the event loop.
     driver = getattr(app.state, "neo4j_driver", None)
     if driver is None:
         raise HTTPException(status_code=500, detail="Neo4j driver not initialized")
@@ -172,15 +323,13 @@ async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
     if openai_client is None:
         raise HTTPException(status_code=500, detail="OpenAI client not initialized")
 
+    requested_at = datetime.now(timezone.utc)
+
     # 1) determine company using LLM-based entity extraction
-    company_name = payload.company
+    company_name = payload.company or _guess_company_from_question(payload.question)
     if not company_name:
         # Use LLM to extract company from question
-        company_name = find_company_name_for_graph(
-            client=openai_client,
-            question=payload.question,
-            confidence_threshold=0.5,
-        )
+        company_name = _cached_company_name_for_question(openai_client, payload.question)
 
     if not company_name:
         raise HTTPException(
@@ -188,10 +337,6 @@ async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
             detail="Could not infer company from question. Provide `company` in the request.",
         )
 
-    company = find_company_by_name(driver, company_name)
-    if not company:
-        raise HTTPException(status_code=404, detail=f"Company not found in graph: {company_name}")
-
     # 2) validate event and signal types
     if not validate_event_type(payload.event_type):
         raise HTTPException(
@@ -215,14 +360,35 @@ async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
         period_a = period_a or default_a
         period_b = period_b or default_b
 
-    company_id = company["id"]
+    # 4) resolve the company (memoized), then query the graph in one round-trip;
+    # both reads share a single session. The name lookup reads up to
+    # COMPANY_NAME_CANDIDATES hits, so the session's PULL batch is sized to fit them
+    def read_graph() -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        with driver.session(default_access_mode=READ_ACCESS, fetch_size=COMPANY_NAME_CANDIDATES) as session:
+            found = _cached_find_company(session, company_name)
+            if not found:
+                return None, None
+            return found, get_ask_bundle(
+                session,
+                found["id"],
+                period_a,
+                period_b,
+                window=payload.window,
+                limit=15,
+                signal_type=payload.signal_type,
+                thresholds=THRESHOLDS_SECONDS,
+            )
+
+    _, bundle = read_graph()
+    if not bundle:
+        raise HTTPException(status_code=404, detail=f"Company not found in graph: {company_name}")
 
-    # 4) freshness check (real, graph-backed)
-    latest_a = get_latest_fetch_by_type(driver, company_id, period_a)
-    latest_b = get_latest_fetch_by_type(driver, company_id, period_b)
+    company = bundle["company"]
+    company_id = company["id"]
 
-    combined_latest = latest_a + latest_b
-    freshness_raw = freshness_check(combined_latest)
+    # 5) freshness check (real, graph-backed)
+    combined_latest = bundle["latest_a"] + bundle["latest_b"]
+    freshness_raw = freshness_check(combined_latest, now=requested_at)
 
     freshness = FreshnessOut(
         was_stale=freshness_raw["was_stale"],
@@ -243,32 +409,25 @@ async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
             period=period_a,
             source_types=freshness_raw["stale_types"],
         )
+        # Re-read so the response reflects the refreshed graph
+        _, refreshed = read_graph()
+        bundle = refreshed or bundle
 
-    # 5) query the graph
-    claims_a_raw = get_claims_with_sources(driver, company_id, period_a, limit=15)
-    claims_b_raw = get_claims_with_sources(driver, company_id, period_b, limit=15)
-
-    # Use generic signal delta (supports all signal types)
-    from graph.queries import get_signal_delta
-    sentiment_raw = get_signal_delta(
-        driver,
-        company_id,
-        period_a,
-        period_b,
-        window=payload.window,
-        signal_type=payload.signal_type,
-    )
+    claims_a_raw = bundle["claims_a"]
+    claims_b_raw = bundle["claims_b"]
+    sentiment_raw = bundle["signal_delta"]
 
     # 6) shape response
+    # Claim rows come straight from our own Cypher projection, so skip
+    # per-field validation and build the models directly.
     def to_claim_out(row: Dict[str, Any]) -> ClaimOut:
-        sources = [SourceOut(**s) for s in (row.get("sources") or []) if s]
-        return ClaimOut(
+        return ClaimOut.model_construct(
             id=row["id"],
             text=row["text"],
             claim_type=row.get("claim_type"),
             confidence=row.get("confidence"),
             last_updated_at=row.get("last_updated_at"),
-            sources=sources,
+            sources=[SourceOut.model_construct(**s) for s in row.get("sources") or []],
         )
 
     def to_signal_out(sig: Optional[Dict[str, Any]]) -> Optional[SentimentSignalOut]:
@@ -292,7 +451,7 @@ async def ask(payload: AskRequest, auto_refresh: bool = Query(False)):
         note=sentiment_raw.get("note"),
     )
 
-    return AskResponse(
+    return AskResponse.model_construct(
         company=company,
         period_a=period_a,
         period_b=period_b,
@@ -55,9 +55,13 @@ import hashlib
 def _stable_id_from_url(url: str) -> str:
     """
     Stable ID derived from URL for idempotent upserts.
+
+    BLAKE2b with a 12-byte digest gives the same 24 hex chars the old
+    truncated SHA-256 did, without hashing bits we throw away. Note: IDs
+    minted before the switch from SHA-256 differ from the current ones.
     """
     normalized = url.strip()
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:24]
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=12).hexdigest()
 
 
 def _stable_id_from_text(*parts: str) -> str:
@@ -66,10 +70,10 @@ def _stable_id_from_text(*parts: str) -> str:
     Use this for Claim IDs (company + timeframe + type + normalized text).
     """
     normalized = " | ".join(p.strip().lower() for p in parts if p is not None).strip()
-    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:24]
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=12).hexdigest()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceDoc:
     """
     Normalized document produced by ingestion.
@@ -96,9 +100,15 @@ class SourceDoc:
     raw_html: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Hashed once per instance (see __post_init__); not part of equality
+    _source_id: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_source_id", _stable_id_from_url(self.url))
+
     @property
     def source_id(self) -> str:
-        return _stable_id_from_url(self.url)
+        return self._source_id
 
 
 ClaimType = Literal[
@@ -122,7 +132,7 @@ ClaimType = Literal[
 Direction = Literal["up", "down", "flat", "mixed", "unknown"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Claim:
     """
     A single structured claim extracted from a source document.
@@ -160,6 +170,22 @@ class Claim:
 
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Hashed once per instance (see __post_init__); not part of equality
+    _claim_id: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_claim_id",
+            _stable_id_from_text(
+                self.company_name,
+                self.period,
+                self.claim_type,
+                self.timeframe or "",
+                self.text,
+            ),
+        )
+
     @property
     def claim_id(self) -> str:
         """
@@ -168,10 +194,4 @@ class Claim:
         We include company + period + type + timeframe + claim text.
         If timeframe is None, it becomes an empty string in the hash.
         """
-        return _stable_id_from_text(
-            self.company_name,
-            self.period,
-            self.claim_type,
-            self.timeframe or "",
-            self.text,
-        )
+        return self._claim_id
@@ -1,11 +1,98 @@
 from __future__ import annotations
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+import hashlib
+import logging
+import os
+import sqlite3
+import httpx
 from openai import OpenAI
 
 from extract.contracts import SourceDoc, Claim
 from extract.schemas import ClaimsPayload
 
+log = logging.getLogger(__name__)
+
+# Bump whenever the extraction prompt or schema changes; it is part of the
+# cache key, so old cached extractions stop matching.
+PROMPT_VERSION = 1
+
+# Local SQLite memo of LLM extractions (source + model + prompt -> payload)
+LLM_CACHE_PATH = Path(os.getenv("PULSEGRAPH_LLM_CACHE", ".cache/llm_claims.sqlite3"))
+
+
+@lru_cache(maxsize=1)
+def get_llm_client() -> OpenAI:
+    """
+    Process-wide OpenAI client on one pooled httpx transport.
+
+    Sharing it keeps TLS connections warm across extractions; HTTP/2 lets
+    the concurrent per-source calls multiplex over a single connection
+    (only when the `h2` package from httpx[http2] is installed).
+    """
+    http = httpx.Client(
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=60.0,
+    )
+    return OpenAI(http_client=http)
+
+
+def _cache_key(
+    source: SourceDoc,
+    company_name: str,
+    period: str,
+    model: str,
+    max_chars: int,
+    text: str,
+) -> str:
+    """
+    Digest of everything that goes into the prompt: the same article
+    extracted for another company or period must not share an entry.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    fields = (source.source_id, source.title, company_name, period, model, str(PROMPT_VERSION), str(max_chars))
+    # \x1f (unit separator) can't collide with "|" inside names or titles
+    h.update("\x1f".join(fields).encode("utf-8"))
+    h.update(b"\x1f")
+    # Include the text itself so a page whose content changed is re-extracted
+    h.update(text.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _cache_connect() -> sqlite3.Connection:
+    LLM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(LLM_CACHE_PATH, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS llm_claims (key TEXT PRIMARY KEY, payload TEXT NOT NULL)")
+    return conn
+
+
+def _cache_load(key: str) -> Optional[ClaimsPayload]:
+    try:
+        with closing(_cache_connect()) as conn:
+            row = conn.execute("SELECT payload FROM llm_claims WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        log.warning("LLM claims cache read failed", exc_info=True)
+        return None
+    return ClaimsPayload.model_validate_json(row[0]) if row else None
+
+
+def _cache_store(key: str, payload: ClaimsPayload) -> None:
+    try:
+        with closing(_cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_claims (key, payload) VALUES (?, ?)",
+                (key, payload.model_dump_json()),
+            )
+    except sqlite3.Error:
+        log.warning("LLM claims cache write failed", exc_info=True)
+
+
 def extract_claims_from_source_openai(
     *,
     client: OpenAI,
@@ -14,10 +101,51 @@ def extract_claims_from_source_openai(
     source: SourceDoc,
     model: str = "gpt-4o-mini",
     max_chars: int = 12000,
+    use_cache: bool = True,
 ) -> List[Claim]:
     # Trim content so calls stay fast and cheap
     text = source.raw_text[:max_chars]
 
+    # Re-extracting the same text with the same model/prompt is memoized
+    key = _cache_key(source, company_name, period, model, max_chars, text) if use_cache else None
+    payload = _cache_load(key) if key else None
+    if payload is None:
+        payload = _extract_payload(client=client, company_name=company_name, period=period,
+                                   source=source, text=text, model=model)
+        if key:
+            _cache_store(key, payload)
+
+    claims: List[Claim] = []
+    for c in payload.claims:
+        claims.append(
+            Claim(
+                company_name=company_name,
+                period=period,
+                text=c.text,
+                claim_type=c.claim_type,
+                direction=c.direction,
+                timeframe=c.timeframe,
+                value=c.value,
+                unit=c.unit,
+                confidence=c.confidence,
+                evidence=c.evidence,
+                source_url=source.url,
+                source_title=source.title,
+            )
+        )
+
+    return claims
+
+
+def _extract_payload(
+    *,
+    client: OpenAI,
+    company_name: str,
+    period: str,
+    source: SourceDoc,
+    text: str,
+    model: str,
+) -> ClaimsPayload:
     prompt = f"""
         Extract earnings-related claims for a knowledge graph.
 
@@ -44,25 +172,50 @@ def extract_claims_from_source_openai(
         max_output_tokens=900,
     )
 
-    payload: ClaimsPayload = resp.output_parsed
+    return resp.output_parsed
 
-    claims: List[Claim] = []
-    for c in payload.claims:
-        claims.append(
-            Claim(
+
+def extract_claims_from_sources_openai(
+    *,
+    client: OpenAI,
+    company_name: str,
+    period: str,
+    sources: Sequence[SourceDoc],
+    model: str = "gpt-4o-mini",
+    max_chars: int = 12000,
+    max_concurrency: int = 8,
+    return_exceptions: bool = False,
+) -> List[Union[List[Claim], Exception]]:
+    """
+    Extract claims from several sources with overlapping OpenAI requests.
+
+    Each source still gets its own request (same prompt and schema as
+    extract_claims_from_source_openai); up to `max_concurrency` run at once on
+    the shared client, so N sources cost roughly one request's latency.
+
+    Returns:
+        One list of claims per source, in the same order as `sources`.
+        The first extraction error is re-raised, unless `return_exceptions`
+        is set: then a failed source's slot holds its exception (like
+        asyncio.gather) and the other sources are unaffected.
+    """
+    if not sources:
+        return []
+
+    def _one(source: SourceDoc) -> Union[List[Claim], Exception]:
+        try:
+            return extract_claims_from_source_openai(
+                client=client,
                 company_name=company_name,
                 period=period,
-                text=c.text,
-                claim_type=c.claim_type,
-                direction=c.direction,
-                timeframe=c.timeframe,
-                value=c.value,
-                unit=c.unit,
-                confidence=c.confidence,
-                evidence=c.evidence,
-                source_url=source.url,
-                source_title=source.title,
+                source=source,
+                model=model,
+                max_chars=max_chars,
             )
-        )
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            return e
 
-    return claims
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(sources))) as pool:
+        return list(pool.map(_one, sources))
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
+from typing import Tuple
+
 from neo4j import GraphDatabase, Driver
 
+
+@lru_cache(maxsize=1)
+def _neo4j_settings() -> Tuple[str, str, str]:
+    """
+    (uri, user, password) read from the environment once per process.
+    Fails fast with a clear error instead of letting the driver choke on None.
+    """
+    settings = []
+    for name in ("NEO4J_URI", "NEO4J_USER", "NEO4J_PASSWORD"):
+        value = os.getenv(name)
+        if not value:
+            raise RuntimeError(f"Missing {name}")
+        settings.append(value)
+    uri, user, password = settings
+    return uri, user, password
+
+
 def get_neo4j_driver() -> Driver:
-    uri = os.getenv("NEO4J_URI")
-    user = os.getenv("NEO4J_USER")
-    password = os.getenv("NEO4J_PASSWORD")  # change locally if needed
-    return GraphDatabase.driver(uri, auth=(user, password))
\ No newline at end of file
+    uri, user, password = _neo4j_settings()
+    return GraphDatabase.driver(
+        uri,
+        auth=(user, password),
+        # Refresh fan-out and /ask workers share this pool; wait up to a
+        # minute for a free connection rather than failing the request
+        max_connection_pool_size=50,
+        connection_acquisition_timeout=60,
+    )
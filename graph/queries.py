@@ -1,38 +1,118 @@
 from __future__ import annotations
 
+import re
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
-from neo4j import Driver
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+from neo4j import Driver, READ_ACCESS, Session
 
 from models.registry import validate_signal_type
 
+# Query helpers accept either a Driver (a read session is opened per call) or
+# an open Session, so a request can run several reads on one session.
+DriverOrSession = Union[Driver, Session]
 
-def find_company_by_name(driver: Driver, name: str) -> Optional[Dict[str, Any]]:
+
+@contextmanager
+def _read_session(db: DriverOrSession, fetch_size: Optional[int] = None) -> Iterator[Session]:
+    """
+    `fetch_size` sizes the PULL batches of a newly opened session to what the
+    query returns (the driver default is 1000), so the server sends the whole
+    result in one chunk.
+    """
+    if isinstance(db, Session):
+        yield db
+    else:
+        config = {"fetch_size": fetch_size} if fetch_size else {}
+        with db.session(default_access_mode=READ_ACCESS, **config) as session:
+            yield session
+
+
+# Characters with meaning in Lucene query syntax (used by full-text indexes)
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+_WORD = re.compile(r"\w+")
+# Legal-form words that don't tell two companies apart
+_NAME_NOISE = frozenset({
+    "the", "inc", "incorporated", "corp", "corporation", "co", "company",
+    "ltd", "limited", "plc", "llc", "lp", "sa", "ag", "nv", "se", "holdings", "group",
+})
+# Full-text hits looked at before giving up on a name
+COMPANY_NAME_CANDIDATES = 5
+
+
+def _name_tokens(text: Optional[str]) -> Set[str]:
+    return set(_WORD.findall((text or "").lower())) - _NAME_NOISE
+
+
+def _is_name_match(name: str, company: Dict[str, Any]) -> bool:
+    """
+    A full-text hit only counts if every significant word of the company name
+    (or its ticker) appears in the queried name: "NVIDIA Corporation" matches
+    NVIDIA, but "Apple" must not match "Apple Hospitality REIT". An exact
+    (case-insensitive) name always counts, even one made only of noise words.
+    """
+    company_name = company.get("name") or ""
+    if company_name and name.strip().lower() == company_name.lower():
+        return True
+    wanted = set(_WORD.findall(name.lower()))
+    ticker = (company.get("ticker") or "").lower()
+    if ticker and ticker in wanted:
+        return True
+    tokens = _name_tokens(company_name)
+    return bool(tokens) and tokens <= wanted
+
+
+def find_company_by_name(driver: DriverOrSession, name: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a company by name or ticker through the company_names full-text
+    index. An exact (case-insensitive) name/ticker match wins; otherwise the
+    best-scoring hit whose name words all appear in `name` is returned, so
+    "NVIDIA Corporation" still finds NVIDIA. Returns None when no hit is
+    close enough.
+    """
+    # Lowercased so words like AND/OR/NOT aren't read as query operators
+    query = _LUCENE_SPECIAL.sub(r"\\\1", name.strip().lower())
+    if not query:
+        return None
+
+    cypher = """
+    CALL db.index.fulltext.queryNodes("company_names", $query) YIELD node, score
+    RETURN node { .id, .name, .ticker, .last_updated_at } AS company
+    ORDER BY toLower($name) IN [toLower(node.name), toLower(coalesce(node.ticker, ""))] DESC,
+             score DESC
+    LIMIT $limit
+    """
+    with _read_session(driver, fetch_size=COMPANY_NAME_CANDIDATES) as session:
+        result = session.run(cypher, query=query, name=name.strip(), limit=COMPANY_NAME_CANDIDATES)
+        for company in result.value("company"):
+            if _is_name_match(name, company):
+                return company
+        return None
+
+
+def list_companies(driver: DriverOrSession) -> List[Dict[str, Any]]:
     cypher = """
     MATCH (c:Company)
-    WHERE toLower(c.name) = toLower($name)
-    RETURN c { .id, .name, .ticker, .last_updated_at } AS company
-    LIMIT 1
+    RETURN c { .id, .name, .ticker } AS company
     """
-    with driver.session() as session:
-        rec = session.run(cypher, name=name).single()
-        return rec["company"] if rec else None
+    with _read_session(driver) as session:
+        return session.run(cypher).value("company")
 
 
-def get_event(driver: Driver, company_id: str, period: str, event_type: str = "earnings") -> Optional[Dict[str, Any]]:
+def get_event(driver: DriverOrSession, company_id: str, period: str, event_type: str = "earnings") -> Optional[Dict[str, Any]]:
     cypher = """
     MATCH (c:Company {id: $company_id})-[:HAS_EVENT]->(e:Event)
     WHERE e.type = $event_type AND e.period = $period
     RETURN e { .id, .type, .period, .event_date, .last_updated_at } AS event
     LIMIT 1
     """
-    with driver.session() as session:
+    with _read_session(driver, fetch_size=1) as session:
         rec = session.run(cypher, company_id=company_id, period=period, event_type=event_type).single()
         return rec["event"] if rec else None
 
 
 def get_claims_with_sources(
-    driver: Driver,
+    driver: DriverOrSession,
     company_id: str,
     period: str,
     limit: int = 15,
@@ -42,17 +122,16 @@ def get_claims_with_sources(
     MATCH (e)-[:HAS_CLAIM]->(cl:Claim)
     OPTIONAL MATCH (s:Source)-[:SUPPORTS]->(cl)
 
-    WITH cl, collect(DISTINCT s{.url,.title,.source_type,.published_at,.fetched_at}) AS sources
+    WITH cl, collect(DISTINCT s{.url,.title,.source_type,.published_at, fetched_at: toString(s.fetched_at)}) AS sources
     RETURN cl { .id, .text, .claim_type, .confidence, .last_updated_at, sources: sources } AS row
     ORDER BY cl.confidence DESC, cl.last_updated_at DESC
     LIMIT $limit
     """
-    with driver.session() as session:
-        rows = session.run(cypher, company_id=company_id, period=period, limit=limit)
-        return [r["row"] for r in rows]
+    with _read_session(driver, fetch_size=limit) as session:
+        return session.run(cypher, company_id=company_id, period=period, limit=limit).value("row")
 
 
-def get_signal(driver: Driver, company_id: str, period: str, window: str, signal_type: str = "sentiment") -> Optional[Dict[str, Any]]:
+def get_signal(driver: DriverOrSession, company_id: str, period: str, window: str, signal_type: str = "sentiment") -> Optional[Dict[str, Any]]:
     cypher = """
     MATCH (c:Company {id: $company_id})-[:HAS_EVENT]->(e:Event {period: $period})
     MATCH (sg:Signal)-[:ABOUT]->(c)
@@ -61,7 +140,7 @@ def get_signal(driver: Driver, company_id: str, period: str, window: str, signal
     RETURN sg { .id, .signal_type, .score, .volume, .window, .computed_at } AS signal
     LIMIT 1
     """
-    with driver.session() as session:
+    with _read_session(driver, fetch_size=1) as session:
         rec = session.run(
             cypher,
             company_id=company_id,
@@ -73,7 +152,7 @@ def get_signal(driver: Driver, company_id: str, period: str, window: str, signal
 
 
 def get_signal_delta(
-    driver: Driver,
+    driver: DriverOrSession,
     company_id: str,
     period_a: str,
     period_b: str,
@@ -84,7 +163,7 @@ def get_signal_delta(
     Compare signal scores for two periods.
 
     Args:
-        driver: Neo4j driver
+        driver: Neo4j driver or open session
         company_id: Company ID
         period_a: First period
         period_b: Second period
@@ -107,9 +186,21 @@ def get_signal_delta(
             "note": f"Invalid signal type: {signal_type}",
         }
 
-    a = get_signal(driver, company_id, period_a, window, signal_type)
-    b = get_signal(driver, company_id, period_b, window, signal_type)
+    with _read_session(driver, fetch_size=1) as session:
+        a = get_signal(session, company_id, period_a, window, signal_type)
+        b = get_signal(session, company_id, period_b, window, signal_type)
 
+    return _build_signal_delta(a, b, period_a, period_b, window, signal_type)
+
+
+def _build_signal_delta(
+    a: Optional[Dict[str, Any]],
+    b: Optional[Dict[str, Any]],
+    period_a: str,
+    period_b: str,
+    window: str,
+    signal_type: str,
+) -> Dict[str, Any]:
     if not a or not b:
         return {
             "period_a": period_a,
@@ -134,7 +225,7 @@ def get_signal_delta(
 
 
 def get_sentiment_delta(
-    driver: Driver,
+    driver: DriverOrSession,
     company_id: str,
     period_a: str,
     period_b: str,
@@ -150,13 +241,161 @@ def get_sentiment_delta(
         driver, company_id, period_a, period_b, window, signal_type="sentiment"
     )
 
-def get_latest_fetch_by_type(driver: Driver, company_id: str, period: str) -> List[Dict[str, Any]]:
+def get_latest_fetch_by_type(
+    driver: DriverOrSession,
+    company_id: str,
+    period: str,
+    thresholds: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Latest fetch time per source type for a company's period.
+
+    If `thresholds` (source_type -> max age in seconds, with an "other"
+    fallback) is given, each row also carries age_s, threshold_s and a `stale`
+    flag computed by Neo4j, so callers don't need to parse timestamps.
+    """
+    # Sources not yet converted by scripts/migrate_fetched_at.py still hold an
+    # ISO string fetched_at; the CASE parses those (toString() is identity
+    # only for strings)
     cypher = """
     MATCH (c:Company {id: $company_id})-[:HAS_EVENT]->(e:Event {period: $period})
     MATCH (e)-[:HAS_CLAIM]->(cl:Claim)<-[:SUPPORTS]-(s:Source)
-    WITH s.source_type AS source_type, max(datetime(s.fetched_at)) AS last_fetched
-    RETURN source_type, toString(last_fetched) AS last_fetched
+    WITH s.source_type AS source_type,
+         max(CASE WHEN s.fetched_at = toString(s.fetched_at) THEN datetime(s.fetched_at) ELSE s.fetched_at END) AS last_fetched
+    WITH source_type, last_fetched,
+         duration.inSeconds(last_fetched, datetime()).seconds AS age_s,
+         coalesce($thresholds[coalesce(source_type, "other")], $thresholds["other"]) AS threshold_s
+    RETURN source_type, toString(last_fetched) AS last_fetched,
+           age_s, threshold_s, age_s > threshold_s AS stale
     """
-    with driver.session() as session:
-        rows = session.run(cypher, company_id=company_id, period=period)
-        return [{"source_type": r["source_type"], "last_fetched": r["last_fetched"]} for r in rows]
\ No newline at end of file
+    with _read_session(driver) as session:
+        return session.run(cypher, company_id=company_id, period=period, thresholds=thresholds).data()
+
+
+def get_recent_source_ids(
+    driver: DriverOrSession,
+    company_id: str,
+    period: str,
+    source_ids: List[str],
+    max_age_s: float,
+) -> Set[str]:
+    """
+    The subset of `source_ids` fetched within the last `max_age_s` seconds
+    that already support one of the company's claims for `period`, i.e. not
+    worth fetching again for this period.
+    """
+    if not source_ids:
+        return set()
+    cypher = """
+    MATCH (s:Source)
+    WHERE s.id IN $source_ids
+      AND s.fetched_at >= datetime() - duration({seconds: toInteger($max_age_s)})
+      AND EXISTS {
+        MATCH (:Company {id: $company_id})-[:HAS_CLAIM {period: $period}]->(:Claim)<-[:SUPPORTS]-(s)
+      }
+    RETURN s.id AS id
+    """
+    with _read_session(driver, fetch_size=len(source_ids)) as session:
+        return set(
+            session.run(
+                cypher, company_id=company_id, period=period, source_ids=source_ids, max_age_s=max_age_s
+            ).value("id")
+        )
+
+
+def get_ask_bundle(
+    driver: DriverOrSession,
+    company_id: str,
+    period_a: str,
+    period_b: str,
+    window: str = "post_earnings_7d",
+    limit: int = 15,
+    signal_type: str = "sentiment",
+    thresholds: Optional[Dict[str, float]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch everything /ask needs for two periods in a single round-trip.
+
+    Combines get_claims_with_sources, get_signal_delta and get_latest_fetch_by_type
+    into one Cypher statement: the company is matched once, then per-period
+    subqueries collect claims, the signal and the latest fetch per source type.
+
+    Returns:
+        Dictionary with company, claims_a/b, latest_a/b (same rows as
+        get_latest_fetch_by_type with `thresholds`) and a signal delta (same
+        shape as get_signal_delta), or None if the company is unknown
+    """
+    # Legacy string fetched_at values are parsed as in get_latest_fetch_by_type
+    cypher = """
+    MATCH (c:Company {id: $company_id})
+    UNWIND [$period_a, $period_b] AS period
+
+    CALL {
+        WITH c, period
+        MATCH (c)-[:HAS_EVENT]->(:Event {period: period})-[:HAS_CLAIM]->(cl:Claim)
+        OPTIONAL MATCH (s:Source)-[:SUPPORTS]->(cl)
+        WITH cl, collect(DISTINCT s{.url,.title,.source_type,.published_at, fetched_at: toString(s.fetched_at)}) AS sources
+        ORDER BY cl.confidence DESC, cl.last_updated_at DESC
+        LIMIT $limit
+        RETURN collect(cl { .id, .text, .claim_type, .confidence, .last_updated_at, sources: sources }) AS claims
+    }
+
+    CALL {
+        WITH c, period
+        MATCH (c)-[:HAS_EVENT]->(e:Event {period: period})
+        MATCH (sg:Signal)-[:ABOUT]->(c)
+        MATCH (sg)-[:IN_WINDOW]->(e)
+        WHERE sg.signal_type = $signal_type AND sg.window = $window
+        RETURN head(collect(sg { .id, .signal_type, .score, .volume, .window, .computed_at })) AS signal
+    }
+
+    CALL {
+        WITH c, period
+        MATCH (c)-[:HAS_EVENT]->(:Event {period: period})-[:HAS_CLAIM]->(:Claim)<-[:SUPPORTS]-(s:Source)
+        WITH s.source_type AS source_type,
+             max(CASE WHEN s.fetched_at = toString(s.fetched_at) THEN datetime(s.fetched_at) ELSE s.fetched_at END) AS last_fetched
+        WITH source_type, last_fetched,
+             duration.inSeconds(last_fetched, datetime()).seconds AS age_s,
+             coalesce($thresholds[coalesce(source_type, "other")], $thresholds["other"]) AS threshold_s
+        RETURN collect({
+            source_type: source_type,
+            last_fetched: toString(last_fetched),
+            age_s: age_s,
+            threshold_s: threshold_s,
+            stale: age_s > threshold_s
+        }) AS latest
+    }
+
+    WITH c, collect({period: period, claims: claims, signal: signal, latest: latest}) AS periods
+    RETURN c { .id, .name, .ticker, .last_updated_at } AS company, periods
+    """
+    with _read_session(driver, fetch_size=1) as session:
+        rec = session.execute_read(
+            lambda tx: tx.run(
+                cypher,
+                company_id=company_id,
+                period_a=period_a,
+                period_b=period_b,
+                window=window,
+                limit=limit,
+                signal_type=signal_type,
+                thresholds=thresholds,
+            ).single()
+        )
+
+    if not rec:
+        return None
+
+    # collect() order isn't guaranteed to follow the UNWIND, so pick by key
+    by_period = {p["period"]: p for p in rec["periods"]}
+    a, b = by_period[period_a], by_period[period_b]
+    return {
+        "company": rec["company"],
+        "claims_a": a["claims"],
+        "claims_b": b["claims"],
+        "latest_a": a["latest"],
+        "latest_b": b["latest"],
+        "signal_delta": _build_signal_delta(
+            a["signal"], b["signal"], period_a, period_b, window, signal_type
+        ),
+    }
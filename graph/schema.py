@@ -2,11 +2,18 @@ from __future__ import annotations
 
 from neo4j import Driver
 
+# Set once the DDL below has run in this process; later calls are no-ops.
+_schema_ensured = False
+
 
 def ensure_schema(driver: Driver) -> None:
     """
     Creates constraints/indexes. Safe to call multiple times.
     """
+    global _schema_ensured
+    if _schema_ensured:
+        return
+
     statements = [
         # Uniqueness constraints
         "CREATE CONSTRAINT company_id IF NOT EXISTS FOR (c:Company) REQUIRE c.id IS UNIQUE",
@@ -20,8 +27,18 @@ def ensure_schema(driver: Driver) -> None:
         "CREATE INDEX event_period IF NOT EXISTS FOR (e:Event) ON (e.period)",
         "CREATE INDEX source_type IF NOT EXISTS FOR (s:Source) ON (s.source_type)",
         "CREATE INDEX claim_type IF NOT EXISTS FOR (cl:Claim) ON (cl.claim_type)",
+        "CREATE INDEX source_fetched_at IF NOT EXISTS FOR (s:Source) ON (s.fetched_at)",
+        "CREATE INDEX source_type_fetched IF NOT EXISTS FOR (s:Source) ON (s.source_type, s.fetched_at)",
+        # Composite lookups used by get_event / get_signal filters
+        "CREATE INDEX event_type_period IF NOT EXISTS FOR (e:Event) ON (e.type, e.period)",
+        "CREATE INDEX signal_type_window IF NOT EXISTS FOR (sg:Signal) ON (sg.signal_type, sg.window)",
+
+        # Full-text (company lookup by name/ticker)
+        "CREATE FULLTEXT INDEX company_names IF NOT EXISTS FOR (c:Company) ON EACH [c.name, c.ticker]",
     ]
 
     with driver.session() as session:
         for stmt in statements:
-            session.run(stmt)
\ No newline at end of file
+            session.run(stmt)
+
+    _schema_ensured = True
@@ -1,189 +1,451 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from datetime import datetime
-from typing import Iterable, List, Optional, Dict, Any
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Iterable, List, Optional, Dict, Any, Tuple, Union
 import hashlib
 
-from neo4j import Driver
+from neo4j import Driver, ManagedTransaction, Record, RoutingControl, Session, Transaction
 
 from extract.contracts import SourceDoc, Claim
 
 
+# Upsert helpers accept a Driver, an open Session, or a transaction, so a
+# caller can run many writes on one session or inside a single transaction
+# function.
+DriverOrTx = Union[Driver, Session, Transaction, ManagedTransaction]
+
+
+def _run_write(
+    db: DriverOrTx,
+    cypher: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    **kwparameters: Any,
+) -> List[Record]:
+    """
+    Run one write query and return its records.
+
+    A Driver goes through execute_query and a Session through execute_write;
+    both are managed transactions the driver retries on transient errors
+    (deadlocks, leader switches). An open transaction runs the query
+    directly: retrying is up to whoever owns it.
+    """
+    params = {**(parameters or {}), **kwparameters}
+    if isinstance(db, (Transaction, ManagedTransaction)):
+        return list(db.run(cypher, params))
+    if isinstance(db, Session):
+        return db.execute_write(lambda tx: list(tx.run(cypher, params)))
+    return db.execute_query(cypher, params, routing_=RoutingControl.WRITE).records
+
+
 def _id(*parts: str) -> str:
     """
     Stable, short id based on semantic components.
+
+    BLAKE2b sized to 12 bytes yields the 24 hex chars directly instead of
+    hashing a full SHA-256 and slicing it. IDs minted before the switch from
+    SHA-256 differ from the current ones.
+
+    Parts are streamed into the hash (see _IdHasher) rather than joined into
+    one string and encoded again; the bytes hashed are the same as
+    "|".join(p.strip() for p in parts if p is not None).
     """
-    s = "|".join(p.strip() for p in parts if p is not None)
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()[:24]
+    return _IdHasher(parts).hexdigest()
 
 
-def upsert_company(driver: Driver, name: str, ticker: Optional[str] = None) -> str:
-    company_id = _id("company", name.lower(), (ticker or "").lower())
-    now = datetime.utcnow().isoformat()
-
-    cypher = """
-    MERGE (c:Company {id: $id})
-    ON CREATE SET c.name = $name,
-                  c.ticker = $ticker,
-                  c.created_at = $now,
-                  c.last_updated_at = $now
-    ON MATCH SET  c.name = $name,
-                  c.ticker = $ticker,
-                  c.last_updated_at = $now
-    RETURN c.id AS id
+# Window size for lowering long text straight into a hash
+_LOWER_CHUNK = 8192
+
+
+def _update_lower(h: "hashlib._Hash", text: str) -> None:
+    """
+    Feed text.lower() into `h` window by window, so a long claim body never
+    exists as a second full-size lowercase copy. Windows end on a space:
+    str.lower() is context-sensitive (Greek final sigma), and a space is a
+    boundary it never looks across, so the bytes match text.lower() exactly.
+    A window with no space would have to be cut mid-word, so the rest of the
+    text is lowered in one piece instead.
     """
-    with driver.session() as session:
-        rec = session.run(cypher, id=company_id, name=name, ticker=ticker, now=now).single()
-        return rec["id"]
+    start, n = 0, len(text)
+    while start < n:
+        end = start + _LOWER_CHUNK
+        if end < n:
+            cut = text.rfind(" ", start + 1, end)
+            end = cut if cut > start else n
+        h.update(text[start:end].lower().encode("utf-8"))
+        start = end
+
+
+class _IdHasher:
+    """
+    Incremental id hash: parts are fed one at a time, separated by "|",
+    skipping None. copy() forks the hash state, so a prefix shared by
+    many ids (e.g. "claim", company_id, event_id) is hashed only once.
+    """
+    __slots__ = ("_h", "_empty")
+
+    def __init__(self, parts: Iterable[Optional[str]] = ()) -> None:
+        self._h = hashlib.blake2b(digest_size=12)
+        self._empty = True
+        self.extend(*parts)
+
+    def _sep(self) -> None:
+        if not self._empty:
+            self._h.update(b"|")
+        self._empty = False
+
+    def extend(self, *parts: Optional[str]) -> "_IdHasher":
+        for p in parts:
+            if p is None:
+                continue
+            self._sep()
+            self._h.update(p.strip().encode("utf-8"))
+        return self
+
+    def extend_lower(self, text: str) -> "_IdHasher":
+        """extend(text.lower()) without materializing the lowered copy."""
+        self._sep()
+        _update_lower(self._h, text.strip())
+        return self
+
+    def copy(self) -> "_IdHasher":
+        clone = _IdHasher.__new__(_IdHasher)
+        clone._h = self._h.copy()
+        clone._empty = self._empty
+        return clone
+
+    def hexdigest(self) -> str:
+        return self._h.hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _claim_id_prefix(company_id: str, event_id: str) -> _IdHasher:
+    # Never extended in place; callers take a copy()
+    return _IdHasher(("claim", company_id, event_id))
+
+
+def _claim_id(company_id: str, event_id: str, text: str) -> str:
+    """
+    Same id as _id("claim", company_id, event_id, text.lower()). The
+    (company, event) prefix state is cached and forked per claim, and the
+    claim text is lowered into the hash incrementally.
+    """
+    return _claim_id_prefix(company_id, event_id).copy().extend_lower(text).hexdigest()
+
+
+def utc_now_iso() -> str:
+    """
+    Timestamp format used for created_at/last_updated_at. Callers writing
+    many records in one pass compute it once and hand it to each helper as
+    `now`.
+    """
+    # Aware UTC (utcnow() is deprecated); seconds are all we need and keep
+    # the strings short
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+_CYPHER_UPSERT_COMPANY = """
+MERGE (c:Company {id: $id})
+ON CREATE SET c.name = $name,
+              c.ticker = $ticker,
+              c.created_at = $now,
+              c.last_updated_at = $now
+ON MATCH SET  c.name = $name,
+              c.ticker = $ticker,
+              c.last_updated_at = $now
+RETURN c.id AS id
+"""
+
+
+def upsert_company(
+    driver: DriverOrTx,
+    name: str,
+    ticker: Optional[str] = None,
+    now: Optional[str] = None,
+) -> str:
+    company_id = _id("company", name.lower(), (ticker or "").lower())
+    now = now or utc_now_iso()
+
+    records = _run_write(driver, _CYPHER_UPSERT_COMPANY, id=company_id, name=name, ticker=ticker, now=now)
+    return records[0]["id"]
+
+
+_CYPHER_UPSERT_EVENT = """
+MATCH (c:Company {id: $company_id})
+MERGE (e:Event {id: $id})
+ON CREATE SET e.type = $type,
+              e.period = $period,
+              e.event_date = $event_date,
+              e.created_at = $now,
+              e.last_updated_at = $now
+ON MATCH SET  e.type = $type,
+              e.period = $period,
+              e.event_date = coalesce($event_date, e.event_date),
+              e.last_updated_at = $now
+MERGE (c)-[:HAS_EVENT]->(e)
+RETURN e.id AS id
+"""
 
 
 def upsert_event(
-    driver: Driver,
+    driver: DriverOrTx,
     company_id: str,
     period: str,
     event_type: str = "earnings",
     event_date: Optional[datetime] = None,
+    now: Optional[str] = None,
 ) -> str:
     event_id = _id("event", company_id, event_type, period)
-    now = datetime.utcnow().isoformat()
+    now = now or utc_now_iso()
     event_date_iso = event_date.isoformat() if event_date else None
 
-    cypher = """
-    MATCH (c:Company {id: $company_id})
-    MERGE (e:Event {id: $id})
-    ON CREATE SET e.type = $type,
-                  e.period = $period,
-                  e.event_date = $event_date,
-                  e.created_at = $now,
-                  e.last_updated_at = $now
-    ON MATCH SET  e.type = $type,
-                  e.period = $period,
-                  e.event_date = coalesce($event_date, e.event_date),
-                  e.last_updated_at = $now
-    MERGE (c)-[:HAS_EVENT]->(e)
-    RETURN e.id AS id
-    """
-    with driver.session() as session:
-        rec = session.run(
-            cypher,
-            company_id=company_id,
-            id=event_id,
-            type=event_type,
-            period=period,
-            event_date=event_date_iso,
-            now=now,
-        ).single()
-        return rec["id"]
-
-
-def upsert_source(driver: Driver, doc: SourceDoc) -> str:
-    now = datetime.utcnow().isoformat()
+    records = _run_write(
+        driver,
+        _CYPHER_UPSERT_EVENT,
+        company_id=company_id,
+        id=event_id,
+        type=event_type,
+        period=period,
+        event_date=event_date_iso,
+        now=now,
+    )
+    return records[0]["id"]
+
+
+_CYPHER_UPSERT_SOURCE = """
+MERGE (s:Source {id: $id})
+ON CREATE SET s.url = $url,
+              s.title = $title,
+              s.source_type = $source_type,
+              s.site_name = $site_name,
+              s.author = $author,
+              s.language = $language,
+              s.query = $search_query,
+              s.published_at = $published_at,
+              s.fetched_at = $fetched_at,
+              s.created_at = $now,
+              s.last_updated_at = $now
+ON MATCH SET  s.title = coalesce($title, s.title),
+              s.source_type = coalesce($source_type, s.source_type),
+              s.site_name = coalesce($site_name, s.site_name),
+              s.author = coalesce($author, s.author),
+              s.language = coalesce($language, s.language),
+              s.query = coalesce($search_query, s.query),
+              s.published_at = coalesce($published_at, s.published_at),
+              s.fetched_at = coalesce($fetched_at, s.fetched_at),
+              s.last_updated_at = $now
+RETURN s.id AS id
+"""
+
+
+def upsert_source(driver: DriverOrTx, doc: SourceDoc, now: Optional[str] = None) -> str:
+    now = now or utc_now_iso()
     published_at = doc.published_at.isoformat() if doc.published_at else None
-    fetched_at = doc.fetched_at.isoformat()
-
-    cypher = """
-    MERGE (s:Source {id: $id})
-    ON CREATE SET s.url = $url,
-                  s.title = $title,
-                  s.source_type = $source_type,
-                  s.site_name = $site_name,
-                  s.author = $author,
-                  s.language = $language,
-                  s.query = $search_query,
-                  s.published_at = $published_at,
-                  s.fetched_at = $fetched_at,
-                  s.created_at = $now,
-                  s.last_updated_at = $now
-    ON MATCH SET  s.title = coalesce($title, s.title),
-                  s.source_type = coalesce($source_type, s.source_type),
-                  s.site_name = coalesce($site_name, s.site_name),
-                  s.author = coalesce($author, s.author),
-                  s.language = coalesce($language, s.language),
-                  s.query = coalesce($search_query, s.query),
-                  s.published_at = coalesce($published_at, s.published_at),
-                  s.fetched_at = coalesce($fetched_at, s.fetched_at),
-                  s.last_updated_at = $now
-    RETURN s.id AS id
+    # Stored as a native (zoned) datetime, not an ISO string, so the
+    # source_fetched_at index can serve max()/range lookups without a cast
+    fetched_at = doc.fetched_at
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+
+    records = _run_write(
+        driver,
+        _CYPHER_UPSERT_SOURCE,
+        id=doc.source_id,
+        url=doc.url,
+        title=doc.title,
+        source_type=doc.source_type,
+        site_name=doc.site_name,
+        author=doc.author,
+        language=doc.language,
+        search_query=doc.query,
+        published_at=published_at,
+        fetched_at=fetched_at,
+        now=now,
+    )
+    return records[0]["id"]
+
+
+def _source_props(doc: SourceDoc) -> Dict[str, Any]:
     """
-    with driver.session() as session:
-        rec = session.run(
-            cypher,
-            id=doc.source_id,
-            url=doc.url,
-            title=doc.title,
-            source_type=doc.source_type,
-            site_name=doc.site_name,
-            author=doc.author,
-            language=doc.language,
-            search_query=doc.query,
-            published_at=published_at,
-            fetched_at=fetched_at,
-            now=now,
-        ).single()
-        return rec["id"]
-
-
-def link_source_mentions_company(driver: Driver, source_id: str, company_id: str) -> None:
-    cypher = """
-    MATCH (s:Source {id: $source_id}), (c:Company {id: $company_id})
-    MERGE (s)-[:MENTIONS]->(c)
+    Mutable Source properties for a batch row. None values are dropped so
+    `s += props` leaves existing values alone, like coalesce() does in
+    upsert_source.
     """
-    with driver.session() as session:
-        session.run(cypher, source_id=source_id, company_id=company_id)
+    fetched_at = doc.fetched_at
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    props = {
+        "title": doc.title,
+        "source_type": doc.source_type,
+        "site_name": doc.site_name,
+        "author": doc.author,
+        "language": doc.language,
+        "query": doc.query,
+        "published_at": doc.published_at.isoformat() if doc.published_at else None,
+        "fetched_at": fetched_at,
+    }
+    return {k: v for k, v in props.items() if v is not None}
+
+
+# Labels merge_nodes_batch may write. Labels can't be query parameters, so
+# they are interpolated into the template and must come from this set.
+_NODE_LABELS = frozenset({"Company", "Event", "Source", "Claim", "Signal"})
+
+
+@lru_cache(maxsize=None)
+def _merge_nodes_cypher(label: str) -> str:
+    """
+    One UNWIND/MERGE template per label, built once. Every batch for a label
+    sends the same query text whatever properties its rows carry, so the
+    server plans it once.
+    """
+    if label not in _NODE_LABELS:
+        raise ValueError(f"Unknown node label: {label}")
+    return f"""
+UNWIND $rows AS row
+MERGE (n:{label} {{id: row.id}})
+ON CREATE SET n += row.create_props,
+              n += $on_create
+SET n += row.props,
+    n += $on_write
+"""
+
+
+def merge_nodes_batch(
+    driver: DriverOrTx,
+    label: str,
+    rows: List[Dict[str, Any]],
+    *,
+    on_create: Optional[Dict[str, Any]] = None,
+    on_write: Optional[Dict[str, Any]] = None,
+) -> List[str]:
+    """
+    Batched MERGE of `label` nodes on id. Each row is
+    {"id": ..., "create_props": {...}, "props": {...}}: create_props are only
+    set on new nodes, props on every write. on_create/on_write are
+    batch-wide values (e.g. timestamps) sent once instead of per row.
+    Returns node ids in input order.
+    """
+    if not rows:
+        return []
+    _run_write(
+        driver,
+        _merge_nodes_cypher(label),
+        rows=rows,
+        on_create=on_create or {},
+        on_write=on_write or {},
+    )
+    return [row["id"] for row in rows]
+
+
+def upsert_sources_batch(
+    driver: DriverOrTx,
+    docs: List[SourceDoc],
+    now: Optional[str] = None,
+) -> List[str]:
+    """
+    Batched upsert_source: one UNWIND query for all docs instead of one
+    session + MERGE per doc. Returns source ids in input order.
+    """
+    now = now or utc_now_iso()
+    rows = [
+        {"id": doc.source_id, "create_props": {"url": doc.url}, "props": _source_props(doc)}
+        for doc in docs
+    ]
+    return merge_nodes_batch(
+        driver,
+        "Source",
+        rows,
+        on_create={"created_at": now},
+        on_write={"last_updated_at": now},
+    )
+
+
+_CYPHER_LINK_SOURCE_MENTIONS = """
+MATCH (s:Source {id: $source_id}), (c:Company {id: $company_id})
+MERGE (s)-[:MENTIONS]->(c)
+"""
+
+
+def link_source_mentions_company(driver: DriverOrTx, source_id: str, company_id: str) -> None:
+    _run_write(driver, _CYPHER_LINK_SOURCE_MENTIONS, source_id=source_id, company_id=company_id)
+
+
+_CYPHER_UPSERT_CLAIM = """
+MATCH (c:Company {id: $company_id})
+MATCH (e:Event {id: $event_id})
+MATCH (s:Source {id: $source_id})
+
+MERGE (cl:Claim {id: $id})
+ON CREATE SET cl.text = $text,
+              cl.claim_type = $claim_type,
+              cl.confidence = $confidence,
+              cl.created_at = $now,
+              cl.last_updated_at = $now
+ON MATCH SET  cl.text = $text,
+              cl.claim_type = $claim_type,
+              cl.confidence = $confidence,
+              cl.last_updated_at = $now
+
+MERGE (e)-[:HAS_CLAIM]->(cl)
+MERGE (s)-[:SUPPORTS]->(cl)
+MERGE (cl)-[:ABOUT]->(c)
+
+RETURN cl.id AS id
+"""
 
 
 def upsert_claim(
-    driver: Driver,
+    driver: DriverOrTx,
     company_id: str,
     event_id: str,
     source_id: str,
     text: str,
     claim_type: str,
     confidence: float,
+    now: Optional[str] = None,
 ) -> str:
-    claim_id = _id("claim", company_id, event_id, text.lower())
-    now = datetime.utcnow().isoformat()
-
-    cypher = """
-    MATCH (c:Company {id: $company_id})
-    MATCH (e:Event {id: $event_id})
-    MATCH (s:Source {id: $source_id})
-
-    MERGE (cl:Claim {id: $id})
-    ON CREATE SET cl.text = $text,
-                  cl.claim_type = $claim_type,
-                  cl.confidence = $confidence,
-                  cl.created_at = $now,
-                  cl.last_updated_at = $now
-    ON MATCH SET  cl.text = $text,
-                  cl.claim_type = $claim_type,
-                  cl.confidence = $confidence,
-                  cl.last_updated_at = $now
-
-    MERGE (e)-[:HAS_CLAIM]->(cl)
-    MERGE (s)-[:SUPPORTS]->(cl)
-    MERGE (cl)-[:ABOUT]->(c)
-
-    RETURN cl.id AS id
-    """
-    with driver.session() as session:
-        rec = session.run(
-            cypher,
-            company_id=company_id,
-            event_id=event_id,
-            source_id=source_id,
-            id=claim_id,
-            text=text,
-            claim_type=claim_type,
-            confidence=confidence,
-            now=now,
-        ).single()
-        return rec["id"]
+    claim_id = _claim_id(company_id, event_id, text)
+    now = now or utc_now_iso()
+
+    records = _run_write(
+        driver,
+        _CYPHER_UPSERT_CLAIM,
+        company_id=company_id,
+        event_id=event_id,
+        source_id=source_id,
+        id=claim_id,
+        text=text,
+        claim_type=claim_type,
+        confidence=confidence,
+        now=now,
+    )
+    return records[0]["id"]
+
+
+_CYPHER_UPSERT_SIGNAL = """
+MATCH (c:Company {id: $company_id})
+MATCH (e:Event {id: $event_id})
+
+MERGE (sg:Signal {id: $id})
+ON CREATE SET sg.signal_type = $signal_type,
+              sg.score = $score,
+              sg.volume = $volume,
+              sg.window = $window,
+              sg.computed_at = $computed_at
+ON MATCH SET  sg.score = $score,
+              sg.volume = $volume,
+              sg.computed_at = $computed_at
+
+MERGE (sg)-[:ABOUT]->(c)
+MERGE (sg)-[:IN_WINDOW]->(e)
+
+RETURN sg.id AS id
+"""
 
 
 def upsert_signal(
-    driver: Driver,
+    driver: DriverOrTx,
     company_id: str,
     event_id: str,
     signal_type: str,
@@ -192,71 +454,53 @@ def upsert_signal(
     window: str,  # e.g. "post_earnings_7d"
     computed_at: Optional[datetime] = None,
 ) -> str:
-    computed_at = computed_at or datetime.utcnow()
+    computed_at = computed_at or datetime.now(timezone.utc)
     signal_id = _id("signal", company_id, event_id, signal_type, window)
     computed_at_iso = computed_at.isoformat()
 
-    cypher = """
-    MATCH (c:Company {id: $company_id})
-    MATCH (e:Event {id: $event_id})
-
-    MERGE (sg:Signal {id: $id})
-    ON CREATE SET sg.signal_type = $signal_type,
-                  sg.score = $score,
-                  sg.volume = $volume,
-                  sg.window = $window,
-                  sg.computed_at = $computed_at
-    ON MATCH SET  sg.score = $score,
-                  sg.volume = $volume,
-                  sg.computed_at = $computed_at
-
-    MERGE (sg)-[:ABOUT]->(c)
-    MERGE (sg)-[:IN_WINDOW]->(e)
-
-    RETURN sg.id AS id
-    """
-    with driver.session() as session:
-        rec = session.run(
-            cypher,
-            company_id=company_id,
-            event_id=event_id,
-            id=signal_id,
-            signal_type=signal_type,
-            score=score,
-            volume=volume,
-            window=window,
-            computed_at=computed_at_iso,
-        ).single()
-        return rec["id"]
+    records = _run_write(
+        driver,
+        _CYPHER_UPSERT_SIGNAL,
+        company_id=company_id,
+        event_id=event_id,
+        id=signal_id,
+        signal_type=signal_type,
+        score=score,
+        volume=volume,
+        window=window,
+        computed_at=computed_at_iso,
+    )
+    return records[0]["id"]
     
     
+_CYPHER_UPSERT_CLAIM_AND_LINKS = """
+MERGE (cl:Claim {id: $claim_id})
+SET cl.text = $text,
+    cl.claim_type = $claim_type,
+    cl.direction = $direction,
+    cl.timeframe = $timeframe,
+    cl.value = $value,
+    cl.unit = $unit,
+    cl.confidence = $confidence,
+    cl.evidence = $evidence
+
+WITH cl
+MATCH (c:Company {id: $company_id})
+MATCH (s:Source {id: $source_id})
+
+MERGE (c)-[:HAS_CLAIM {period: $period}]->(cl)
+MERGE (s)-[:SUPPORTS]->(cl)
+"""
+
+
 def upsert_claim_and_links(
-    driver,
+    driver: DriverOrTx,
     *,
     company_id: str,
     source_id: str,
     period: str,
     claim: Claim,
 ):
-    cypher = """
-    MERGE (cl:Claim {id: $claim_id})
-    SET cl.text = $text,
-        cl.claim_type = $claim_type,
-        cl.direction = $direction,
-        cl.timeframe = $timeframe,
-        cl.value = $value,
-        cl.unit = $unit,
-        cl.confidence = $confidence,
-        cl.evidence = $evidence
-
-    WITH cl
-    MATCH (c:Company {id: $company_id})
-    MATCH (s:Source {id: $source_id})
-
-    MERGE (c)-[:HAS_CLAIM {period: $period}]->(cl)
-    MERGE (s)-[:SUPPORTS]->(cl)
-    """
-
     params = {
         "claim_id": claim.claim_id,
         "text": claim.text,
@@ -272,5 +516,79 @@ def upsert_claim_and_links(
         "period": period,
     }
 
-    with driver.session() as session:
-        session.run(cypher, params)
\ No newline at end of file
+    _run_write(driver, _CYPHER_UPSERT_CLAIM_AND_LINKS, params)
+
+
+_CYPHER_UPSERT_CLAIMS_BATCH = """
+MATCH (c:Company {id: $company_id})
+UNWIND $groups AS g
+MATCH (s:Source {id: g.source_id})
+UNWIND g.claims AS row
+
+MERGE (cl:Claim {id: row.claim_id})
+SET cl += row.props
+
+MERGE (c)-[:HAS_CLAIM {period: $period}]->(cl)
+MERGE (s)-[:SUPPORTS]->(cl)
+"""
+
+
+def upsert_claims_batch(
+    driver: DriverOrTx,
+    *,
+    company_id: str,
+    period: str,
+    claims: Iterable[Tuple[str, Claim]],
+) -> int:
+    """
+    Batched upsert_claim_and_links for (source_id, claim) pairs: one UNWIND
+    query per refresh instead of one session + MERGE per claim.
+
+    Claims are grouped by source so the Company is matched once per batch
+    and each Source once per group, not once per claim.
+    Returns the number of claim rows sent.
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    count = 0
+    for source_id, claim in claims:
+        groups.setdefault(source_id, []).append(
+            {
+                "claim_id": claim.claim_id,
+                # None values are kept on purpose: like the per-claim SET,
+                # they clear the property
+                "props": {
+                    "text": claim.text,
+                    "claim_type": claim.claim_type,
+                    "direction": claim.direction,
+                    "timeframe": claim.timeframe,
+                    "value": claim.value,
+                    "unit": claim.unit,
+                    "confidence": claim.confidence,
+                    "evidence": claim.evidence,
+                },
+            }
+        )
+        count += 1
+    if not count:
+        return 0
+
+    rows = [{"source_id": source_id, "claims": group} for source_id, group in groups.items()]
+    _run_write(driver, _CYPHER_UPSERT_CLAIMS_BATCH, groups=rows, company_id=company_id, period=period)
+    return count
+
+
+_CYPHER_LINK_SOURCES_MENTION = """
+MATCH (c:Company {id: $company_id})
+UNWIND $source_ids AS source_id
+MATCH (s:Source {id: source_id})
+MERGE (s)-[:MENTIONS]->(c)
+"""
+
+
+def link_sources_mention_company(driver: DriverOrTx, source_ids: List[str], company_id: str) -> None:
+    """
+    Batched link_source_mentions_company.
+    """
+    if not source_ids:
+        return
+    _run_write(driver, _CYPHER_LINK_SOURCES_MENTION, source_ids=source_ids, company_id=company_id)
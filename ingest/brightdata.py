@@ -1,18 +1,32 @@
 from __future__ import annotations
 
+import atexit
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Any, Dict, List, Optional
-from urllib.parse import quote_plus
+from urllib.parse import urlencode
 
-import requests
+import httpx
+import orjson
 
 
 BRIGHTDATA_REQUEST_URL = "https://api.brightdata.com/request"
 
+# SERP and Unlocker calls all go to the same endpoint, so one pooled client
+# keeps a warm connection instead of a TCP+TLS handshake per request.
+# HTTP/2 (multiplexed concurrent fetches) needs the h2 package.
+_HTTP = httpx.Client(
+    http2=find_spec("h2") is not None,
+    timeout=120.0,
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+)
+atexit.register(_HTTP.close)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SerpResult:
     url: str
     title: Optional[str] = None
@@ -30,6 +44,18 @@ def _headers() -> Dict[str, str]:
     }
 
 
+@lru_cache(maxsize=1024)
+def _serp_url(query: str, gl: str, hl: str, tbm: Optional[str]) -> str:
+    """
+    Google search URL for the SERP API (brd_json=1 asks for parsed JSON).
+    Cached: retries and overlapping refreshes reuse the same queries.
+    """
+    params = {"q": query, "gl": gl, "hl": hl, "brd_json": "1"}
+    if tbm:
+        params["tbm"] = tbm
+    return "https://www.google.com/search?" + urlencode(params)
+
+
 def google_serp_urls(
     query: str,
     *,
@@ -48,10 +74,7 @@ def google_serp_urls(
     if not zone:
         raise RuntimeError("Missing BRIGHTDATA_SERP_ZONE")
 
-    q = quote_plus(query)
-    base = f"https://www.google.com/search?q={q}&gl={gl}&hl={hl}&brd_json=1"
-    if tbm:
-        base += f"&tbm={tbm}"
+    base = _serp_url(query, gl, hl, tbm)
 
     payload = {
         "zone": zone,
@@ -59,10 +82,10 @@ def google_serp_urls(
         "format": "raw",
     }
 
-    resp = requests.post(BRIGHTDATA_REQUEST_URL, headers=_headers(), json=payload, timeout=90)
+    resp = _HTTP.post(BRIGHTDATA_REQUEST_URL, headers=_headers(), content=orjson.dumps(payload), timeout=90)
     resp.raise_for_status()
     # When using brd_json=1, the response is typically JSON.
-    data = resp.json()
+    data = orjson.loads(resp.content)
     # Be defensive: field names can vary based on engine/format.
     candidates = []
     for key in ("organic", "organic_results", "results", "search_results", "news"):
@@ -112,9 +135,10 @@ def unlock_to_markdown(url: str, *, country: str = "us") -> str:
         "data_format": "markdown",
     }
 
-    resp = requests.post(BRIGHTDATA_REQUEST_URL, headers=_headers(), json=payload, timeout=120)
+    resp = _HTTP.post(BRIGHTDATA_REQUEST_URL, headers=_headers(), content=orjson.dumps(payload), timeout=120)
     resp.raise_for_status()
-    data = resp.json()
+    # orjson: the markdown body can be hundreds of KB
+    data = orjson.loads(resp.content)
     # Different responses may embed content under different keys; handle common ones.
     for key in ("data", "content", "markdown", "result", "body"):
         val = data.get(key)
@@ -1,27 +1,105 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
-from openai import OpenAI
-
+import re
+import time
 
 from neo4j import Driver
 
-from extract.contracts import SourceDoc
-from extract.llm_claims import extract_claims_from_source_openai
+from agent.freshness import THRESHOLDS_SECONDS
+from extract.contracts import SourceDoc, _stable_id_from_url
+from extract.llm_claims import extract_claims_from_sources_openai, get_llm_client
 
-from graph.upsert import upsert_source, link_source_mentions_company
+from graph.upsert import (
+    upsert_sources_batch,
+    upsert_claims_batch,
+    link_sources_mention_company,
+    utc_now_iso,
+)
 
-from ingest.brightdata import google_serp_urls, unlock_to_markdown
-from ingest.llm_query_gen import generate_search_query
+from graph.queries import get_recent_source_ids
 
-from graph.upsert import upsert_claim_and_links
+from ingest.brightdata import SerpResult, google_serp_urls, unlock_to_markdown
+from ingest.llm_query_gen import generate_search_query
 
 
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
+# Unlocker fetches are pure network waits; run this many at once
+FETCH_CONCURRENCY = 8
+
+# Cap on the markdown kept per page; extraction trims further to its own
+# max_chars, this keeps section selection and memory bounded
+MAX_DOC_CHARS = 16000
+
+# Markdown headings that mark the parts of a page worth sending to the LLM
+_HEADING = re.compile(r"^#{1,6}\s", re.MULTILINE)
+_RELEVANT_HEADING = re.compile(
+    r"earnings|guidance|revenue|\beps\b|outlook|results|forecast|quarter",
+    re.IGNORECASE,
+)
+
+
+def _focus_markdown(md: str, max_chars: int = MAX_DOC_CHARS) -> str:
+    """
+    Keep the lead (text before the first heading) plus the sections whose
+    heading looks earnings-related, then cap the length. Pages with no
+    matching heading are kept whole (and capped), so plain articles are not
+    emptied out.
+    """
+    starts = [m.start() for m in _HEADING.finditer(md)]
+    if starts:
+        bounds = starts + [len(md)]
+        sections = [md[a:b] for a, b in zip(bounds, bounds[1:])]
+        keep = [sec for sec in sections if _RELEVANT_HEADING.search(sec.split("\n", 1)[0])]
+        if keep:
+            md = md[:starts[0]] + "".join(keep)
+    return md[:max_chars]
+
+
+# (company_id, period, source_id) -> time.monotonic() of the last write by
+# this process, so hot URLs are skipped without asking Neo4j. Reset when full.
+_recent_sources: Dict[Tuple[str, str, str], float] = {}
+_RECENT_SOURCES_MAX = 10_000
+
+
+def _drop_fresh_urls(
+    driver: Driver,
+    company_id: str,
+    period: str,
+    serp_results: List[SerpResult],
+    max_age_s: float,
+) -> List[SerpResult]:
+    """
+    Drop duplicate SERP URLs and URLs whose Source was fetched for this
+    company and period within `max_age_s`: re-fetching them would pay for Unlocker and
+    LLM calls only for the MERGE to change nothing.
+    """
+    now = time.monotonic()
+    todo: Dict[str, SerpResult] = {}
+    for r in serp_results:
+        source_id = _stable_id_from_url(r.url)
+        seen_at = _recent_sources.get((company_id, period, source_id))
+        if source_id in todo or (seen_at is not None and now - seen_at < max_age_s):
+            continue
+        todo[source_id] = r
+
+    fresh = get_recent_source_ids(driver, company_id, period, list(todo), max_age_s)
+    return [r for source_id, r in todo.items() if source_id not in fresh]
+
+
+def _remember_sources(company_id: str, period: str, source_ids: List[str]) -> None:
+    if len(_recent_sources) > _RECENT_SOURCES_MAX:
+        _recent_sources.clear()
+    now = time.monotonic()
+    for source_id in source_ids:
+        _recent_sources[(company_id, period, source_id)] = now
+
+
 def refresh_company_period(
     driver: Driver,
     company_id: str,
@@ -48,7 +126,7 @@ def refresh_company_period(
     Returns:
         Dictionary with refresh statistics
     """
-    llm_client = OpenAI()
+    llm_client = get_llm_client()
     source_types = source_types or ["news"]
 
     # 1) Generate intelligent search query using LLM
@@ -69,16 +147,26 @@ def refresh_company_period(
     # 2) Discover URLs via SERP (use Google News vertical to bias toward coverage)
     serp_results = google_serp_urls(serp_query, max_results=5, tbm="nws")
 
-    # 3) Fetch pages via Unlocker (markdown), normalize to SourceDoc, upsert
+    # Skip URLs already ingested for this company and period within the news
+    # freshness window (docs below are all typed "news")
+    to_fetch = _drop_fresh_urls(driver, company_id, period, serp_results, THRESHOLDS_SECONDS["news"])
+    if len(to_fetch) < len(serp_results):
+        log.info("Skipping %d already-fresh URLs", len(serp_results) - len(to_fetch))
+
+    # 3) Fetch pages via Unlocker (markdown) concurrently, normalize to SourceDoc
     upserted = 0
     docs: List[SourceDoc] = []
     errors: List[Dict] = []
 
-    for r in serp_results:
+    with ThreadPoolExecutor(max_workers=max(1, min(FETCH_CONCURRENCY, len(to_fetch)))) as pool:
+        pages = [pool.submit(unlock_to_markdown, r.url, country="us") for r in to_fetch]
+
+    for r, page in zip(to_fetch, pages):
         try:
-            md = unlock_to_markdown(r.url, country="us")
+            md = page.result()
             if not md:
                 continue
+            md = _focus_markdown(md)
             doc = SourceDoc(
                 url=r.url,
                 title=r.title or r.url,
@@ -95,32 +183,49 @@ def refresh_company_period(
             )
             docs.append(doc)
             log.info("Fetched source %s (%d chars)", doc.url, len(doc.raw_text))
-            source_id = upsert_source(driver, doc)
-
-            # 4) Extract claims using OpenAI + upsert into graph
-            claims = extract_claims_from_source_openai(
-                client=llm_client,
-                company_name=company_name,
-                period=period,
-                source=doc,
-            )
-
-            for claim in claims:
-                upsert_claim_and_links(
-                    driver,
-                    company_id=company_id,
-                    source_id=source_id,
-                    period=period,
-                    claim=claim,
-                )
-
-            link_source_mentions_company(driver, source_id, company_id)
-            upserted += 1
 
         except Exception as e:
+            # One bad URL shouldn't cost the rest of the batch
+            log.exception("Fetching %s failed", r.url)
             errors.append({"url": r.url, "error": str(e)})
-            raise e
-            
+
+    # 4) Extract claims for all fetched docs at once using OpenAI
+    claims_per_doc = extract_claims_from_sources_openai(
+        client=llm_client,
+        company_name=company_name,
+        period=period,
+        sources=docs,
+        return_exceptions=True,
+    )
+
+    # Docs whose extraction failed are left out of the write, so they are
+    # retried on the next refresh instead of being recorded as fresh
+    extracted: List[SourceDoc] = []
+    claim_rows = []
+    for doc, claims in zip(docs, claims_per_doc):
+        if isinstance(claims, Exception):
+            log.error("Extracting claims from %s failed", doc.url, exc_info=claims)
+            errors.append({"url": doc.url, "error": str(claims)})
+            continue
+        extracted.append(doc)
+        claim_rows.extend((doc.source_id, claim) for claim in claims)
+
+    # 5) Flush sources, claims and mentions to the graph in one transaction
+    # (a retry of the transaction function replays all three batches)
+
+    now = utc_now_iso()
+
+    def _flush(tx) -> List[str]:
+        source_ids = upsert_sources_batch(tx, extracted, now=now)
+        upsert_claims_batch(tx, company_id=company_id, period=period, claims=claim_rows)
+        link_sources_mention_company(tx, source_ids, company_id)
+        return source_ids
+
+    with driver.session() as session:
+        source_ids = session.execute_write(_flush)
+    # Same rule as get_recent_source_ids: only sources backing a claim count
+    _remember_sources(company_id, period, list({source_id for source_id, _ in claim_rows}))
+    upserted = len(source_ids)
 
     return {
         "company": company_name,
@@ -130,8 +235,9 @@ def refresh_company_period(
         "query_keywords": query_obj.keywords,
         "query_alternatives": query_obj.alternative_queries,
         "discovered_urls": len(serp_results),
+        "skipped_fresh_urls": len(serp_results) - len(to_fetch),
         "fetched_docs": len(docs),
         "upserted_sources": upserted,
         "errors": errors[:3],  # keep response small
-        "refreshed_at": datetime.now(timezone.utc).isoformat(),
+        "refreshed_at": now,
     }
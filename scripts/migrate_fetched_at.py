@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+One-off migration: Source.fetched_at used to be written as an ISO string.
+Convert any remaining string values to native datetimes so freshness
+queries compare (and index) them correctly.
+
+Safe to re-run; already-converted sources are left alone.
+"""
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+from graph.db import get_neo4j_driver
+
+
+# toString() is identity only for strings, so this matches string values alone
+MIGRATE_FETCHED_AT = """
+MATCH (s:Source) WHERE s.fetched_at = toString(s.fetched_at)
+CALL {
+    WITH s
+    SET s.fetched_at = datetime(s.fetched_at)
+} IN TRANSACTIONS OF 10000 ROWS
+"""
+
+
+def main():
+    driver = get_neo4j_driver()
+
+    # CALL ... IN TRANSACTIONS needs an auto-commit transaction (session.run)
+    with driver.session() as session:
+        summary = session.run(MIGRATE_FETCHED_AT).consume()
+
+    print(f"Converted fetched_at on {summary.counters.properties_set} sources.")
+    driver.close()
+
+
+if __name__ == "__main__":
+    main()
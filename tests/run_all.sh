@@ -15,7 +15,43 @@ python3 tests/test_periods.py
 PERIODS_EXIT=$?
 echo ""
 
-echo "🧪 Test 2: Entity Extraction (requires OpenAI API key)"
+echo "🧪 Test 2: Freshness Checks"
+echo "------------------------------------------"
+python3 tests/test_freshness.py
+FRESHNESS_EXIT=$?
+echo ""
+
+echo "🧪 Test 3: LLM Extraction Cache"
+echo "------------------------------------------"
+python3 tests/test_llm_cache.py
+LLM_CACHE_EXIT=$?
+echo ""
+
+echo "🧪 Test 4: Graph Node IDs"
+echo "------------------------------------------"
+python3 tests/test_ids.py
+IDS_EXIT=$?
+echo ""
+
+echo "🧪 Test 5: Page Section Selection"
+echo "------------------------------------------"
+python3 tests/test_focus_markdown.py
+FOCUS_EXIT=$?
+echo ""
+
+echo "🧪 Test 6: Question Company Matching"
+echo "------------------------------------------"
+python3 tests/test_company_match.py
+COMPANY_MATCH_EXIT=$?
+echo ""
+
+echo "🧪 Test 7: Company Name Lookup"
+echo "------------------------------------------"
+python3 tests/test_name_match.py
+NAME_MATCH_EXIT=$?
+echo ""
+
+echo "🧪 Test 8: Entity Extraction (requires OpenAI API key)"
 echo "------------------------------------------"
 if [ -z "$OPENAI_API_KEY" ]; then
     echo "⚠️  Warning: OPENAI_API_KEY not set. Skipping entity extraction tests."
@@ -45,6 +81,42 @@ else
     echo "❌ Period Calculation Tests: FAILED"
 fi
 
+if [ $FRESHNESS_EXIT -eq 0 ]; then
+    echo "✅ Freshness Tests: PASSED"
+else
+    echo "❌ Freshness Tests: FAILED"
+fi
+
+if [ $LLM_CACHE_EXIT -eq 0 ]; then
+    echo "✅ LLM Cache Tests: PASSED"
+else
+    echo "❌ LLM Cache Tests: FAILED"
+fi
+
+if [ $IDS_EXIT -eq 0 ]; then
+    echo "✅ Node ID Tests: PASSED"
+else
+    echo "❌ Node ID Tests: FAILED"
+fi
+
+if [ $FOCUS_EXIT -eq 0 ]; then
+    echo "✅ Focus Markdown Tests: PASSED"
+else
+    echo "❌ Focus Markdown Tests: FAILED"
+fi
+
+if [ $COMPANY_MATCH_EXIT -eq 0 ]; then
+    echo "✅ Company Match Tests: PASSED"
+else
+    echo "❌ Company Match Tests: FAILED"
+fi
+
+if [ $NAME_MATCH_EXIT -eq 0 ]; then
+    echo "✅ Name Match Tests: PASSED"
+else
+    echo "❌ Name Match Tests: FAILED"
+fi
+
 if [ -z "$OPENAI_API_KEY" ]; then
     echo "⏭️  Entity Extraction Tests: SKIPPED (no API key)"
 elif [ $ENTITY_EXIT -eq 0 ]; then
@@ -56,7 +128,7 @@ fi
 echo ""
 
 # Exit with failure if any test failed
-if [ $PERIODS_EXIT -ne 0 ] || [ $ENTITY_EXIT -ne 0 ]; then
+if [ $PERIODS_EXIT -ne 0 ] || [ $FRESHNESS_EXIT -ne 0 ] || [ $LLM_CACHE_EXIT -ne 0 ] || [ $IDS_EXIT -ne 0 ] || [ $FOCUS_EXIT -ne 0 ] || [ $COMPANY_MATCH_EXIT -ne 0 ] || [ $NAME_MATCH_EXIT -ne 0 ] || [ $ENTITY_EXIT -ne 0 ]; then
     exit 1
 else
     exit 0
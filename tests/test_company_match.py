@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for resolving a company named outright in an /ask question
+(api.main._build_company_matcher / _guess_company_from_question).
+
+Usage:
+    python3 tests/test_company_match.py
+
+    Or from project root:
+    python3 -m tests.test_company_match
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from api.main import _build_company_matcher, _guess_company_from_question
+
+
+COMPANIES = [
+    {"name": "NVIDIA", "ticker": "NVDA"},
+    {"name": "C3.ai", "ticker": "AI"},
+    {"name": "ServiceNow", "ticker": "NOW"},
+    {"name": "Meta Platforms, Inc.", "ticker": "META"},
+    {"name": "Tesla", "ticker": "TSLA"},
+    {"name": "Tesla Energy", "ticker": None},
+    {"name": "Agilent", "ticker": "A"},
+]
+
+
+def test_company_match():
+    """Test company name and ticker matching in questions."""
+    print("=" * 80)
+    print("Testing Company Matching")
+    print("=" * 80)
+
+    _build_company_matcher(COMPANIES)
+
+    test_cases = [
+        # (question, expected company)
+        # Name wins over a ticker anywhere in the question
+        ("Is AI hype hurting NVIDIA?", "NVIDIA"),
+        ("Did nvidia beat estimates?", "NVIDIA"),
+        # Common-word tickers only count as cashtags
+        ("Is AI overhyped?", None),
+        ("What changed for $AI this quarter?", "C3.ai"),
+        ("Should I buy now?", None),
+        ("Is NOW a buy?", None),
+        ("How did $NOW guide?", "ServiceNow"),
+        # Tickers are exact-case
+        ("How did TSLA do?", "Tesla"),
+        ("How did tsla do?", None),
+        ("What about NVDA guidance?", "NVIDIA"),
+        # Names ending in punctuation
+        ("Meta Platforms, Inc. guidance", "Meta Platforms, Inc."),
+        ("meta platforms, inc.?", "Meta Platforms, Inc."),
+        # Longest name wins; names/tickers don't match inside words
+        ("Tesla Energy storage deployments", "Tesla Energy"),
+        ("NVDAX fund flows", None),
+        # Single-letter tickers are skipped
+        ("Is A a buy?", None),
+        ("Nothing relevant here", None),
+    ]
+
+    for question, expected in test_cases:
+        result = _guess_company_from_question(question)
+        status = "✓" if result == expected else "✗"
+        print(f"{status} {question!r} → {result!r} (expected {expected!r})")
+        assert result == expected
+
+    print()
+
+
+if __name__ == "__main__":
+    test_company_match()
+
+    print("=" * 80)
+    print("All Company Match Tests Complete!")
+    print("=" * 80)
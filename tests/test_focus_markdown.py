@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for trimming fetched pages before claim extraction
+(ingest.refresh._focus_markdown).
+
+Usage:
+    python3 tests/test_focus_markdown.py
+
+    Or from project root:
+    python3 -m tests.test_focus_markdown
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ingest.refresh import _focus_markdown
+
+
+PAGE = (
+    "NVIDIA reported results after the bell.\n\n"
+    "## Subscribe to our newsletter\nSign up today.\n\n"
+    "## Q3 Earnings\nRevenue rose 94%.\n\n"
+    "### Related stories\nMore links.\n\n"
+    "## Guidance and outlook\nQ4 revenue seen at $37.5B.\n"
+)
+
+
+def test_focus_sections():
+    """Test that the lead and only earnings-related sections are kept."""
+    print("=" * 80)
+    print("Testing Section Selection")
+    print("=" * 80)
+
+    out = _focus_markdown(PAGE)
+    test_cases = [
+        # (description, fragment, expected to be kept)
+        ("lead before first heading", "NVIDIA reported results after the bell.", True),
+        ("earnings section", "## Q3 Earnings\nRevenue rose 94%.", True),
+        ("guidance section", "## Guidance and outlook\nQ4 revenue seen at $37.5B.", True),
+        ("newsletter section", "Subscribe to our newsletter", False),
+        ("related stories section", "Related stories", False),
+    ]
+
+    for description, fragment, expected in test_cases:
+        kept = fragment in out
+        status = "✓" if kept == expected else "✗"
+        print(f"{status} {description}: {'kept' if kept else 'dropped'} (expected {'kept' if expected else 'dropped'})")
+        assert kept == expected
+
+    print()
+
+
+def test_focus_caps():
+    """Test that pages without matching headings are kept whole, then capped."""
+    print("=" * 80)
+    print("Testing Length Caps")
+    print("=" * 80)
+
+    no_headings = "Plain article text. " * 100
+    unrelated = "# About us\nWho we are.\n\n## Contact\nEmail us.\n"
+    test_cases = [
+        # (description, markdown, max_chars, expected output)
+        ("no headings, under cap", no_headings, 5000, no_headings),
+        ("no headings, over cap", no_headings, 50, no_headings[:50]),
+        ("no matching heading", unrelated, 5000, unrelated),
+        ("matching sections, over cap", PAGE, 60, _focus_markdown(PAGE)[:60]),
+        ("empty page", "", 100, ""),
+    ]
+
+    for description, md, max_chars, expected in test_cases:
+        out = _focus_markdown(md, max_chars)
+        ok = out == expected and len(out) <= max_chars
+        status = "✓" if ok else "✗"
+        print(f"{status} {description}: {len(md)} → {len(out)} chars")
+        assert ok
+
+    print()
+
+
+if __name__ == "__main__":
+    test_focus_sections()
+    test_focus_caps()
+
+    print("=" * 80)
+    print("All Focus Markdown Tests Complete!")
+    print("=" * 80)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test script for source freshness checks.
+
+Usage:
+    python3 tests/test_freshness.py
+
+    Or from project root:
+    python3 -m tests.test_freshness
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from datetime import datetime, timedelta, timezone
+from agent.freshness import freshness_check
+
+
+def _ago(**kwargs) -> str:
+    return (datetime.now(timezone.utc) - timedelta(**kwargs)).isoformat()
+
+
+def test_freshness_thresholds():
+    """Test per-source-type staleness thresholds."""
+    print("=" * 80)
+    print("Testing Freshness Thresholds")
+    print("=" * 80)
+
+    test_cases = [
+        # (rows, expected stale types)
+        ([{"source_type": "news", "last_fetched": _ago(hours=1)}], []),
+        ([{"source_type": "news", "last_fetched": _ago(hours=25)}], ["news"]),
+        ([{"source_type": "blog", "last_fetched": _ago(hours=25)}], []),
+        ([{"source_type": "forum", "last_fetched": _ago(hours=7)}], ["forum"]),
+        ([{"source_type": "docs", "last_fetched": _ago(hours=25)}], ["docs"]),
+        ([{"source_type": None, "last_fetched": _ago(hours=1)}], []),
+        ([{"source_type": "social", "last_fetched": None}], ["social"]),
+        (
+            [
+                {"source_type": "news", "last_fetched": _ago(hours=30)},
+                {"source_type": "news", "last_fetched": _ago(hours=40)},
+                {"source_type": "blog", "last_fetched": _ago(hours=1)},
+            ],
+            ["news"],
+        ),
+        ([], []),
+    ]
+
+    for rows, expected in test_cases:
+        result = freshness_check(rows)
+        ok = result["stale_types"] == expected and result["was_stale"] == bool(expected)
+        status = "✓" if ok else "✗"
+        types = [r["source_type"] for r in rows]
+        print(f"{status} {types} → stale={result['stale_types']} (expected {expected})")
+        assert ok
+
+    print()
+
+
+def test_freshness_zulu_timestamps():
+    """Test Neo4j-style timestamps ending in Z."""
+    print("=" * 80)
+    print("Testing Zulu Timestamps")
+    print("=" * 80)
+
+    last = (datetime.now(timezone.utc) - timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    result = freshness_check([{"source_type": "news", "last_fetched": last}])
+    detail = result["details"][0]
+
+    status = "✓" if not result["was_stale"] else "✗"
+    print(f"{status} {last} → was_stale={result['was_stale']}")
+    print(f"  Threshold: {detail['threshold_hours']}h")
+    print(f"  Checked at: {result['checked_at']}")
+    assert not result["was_stale"]
+    assert detail["threshold_hours"] == 24.0
+
+    print()
+
+
+def test_freshness_graph_verdicts():
+    """Test rows that already carry a `stale` flag from Neo4j."""
+    print("=" * 80)
+    print("Testing Graph-Computed Verdicts")
+    print("=" * 80)
+
+    rows = [
+        {"source_type": "news", "last_fetched": "2025-01-01T00:00:00Z", "threshold_s": 86400.0, "stale": True},
+        {"source_type": "blog", "last_fetched": "2025-01-01T00:00:00Z", "threshold_s": 172800.0, "stale": False},
+        # No timestamp: Neo4j returns a null verdict, checked locally
+        {"source_type": "forum", "last_fetched": None, "threshold_s": 21600.0, "stale": None},
+    ]
+    result = freshness_check(rows)
+
+    ok = result["stale_types"] == ["forum", "news"]
+    status = "✓" if ok else "✗"
+    print(f"{status} stale={result['stale_types']} (expected ['forum', 'news'])")
+    for detail in result["details"]:
+        print(f"  {detail['source_type']}: last={detail['last_fetched']} threshold={detail['threshold_hours']}h")
+    assert ok
+    assert result["details"][1]["threshold_hours"] == 48.0
+
+    print()
+
+
+if __name__ == "__main__":
+    test_freshness_thresholds()
+    test_freshness_zulu_timestamps()
+    test_freshness_graph_verdicts()
+
+    print("=" * 80)
+    print("All Freshness Tests Complete!")
+    print("=" * 80)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for graph node ids (graph.upsert._id / _claim_id).
+
+The incremental hasher must give the same ids as hashing the plain
+"|".join(...) string, or re-ingested data would stop MERGE-ing onto
+existing nodes.
+
+Usage:
+    python3 tests/test_ids.py
+
+    Or from project root:
+    python3 -m tests.test_ids
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from graph.upsert import _claim_id, _id
+
+
+def _reference_id(*parts):
+    """The straightforward form: join stripped parts, skipping None, and hash."""
+    s = "|".join(p.strip() for p in parts if p is not None)
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def test_id():
+    """Test _id against the joined-string form."""
+    print("=" * 80)
+    print("Testing _id")
+    print("=" * 80)
+
+    test_cases = [
+        ("company", "nvidia", "nvda"),
+        ("company", "nvidia", ""),          # empty part
+        ("source", None, "abc"),            # None part
+        (None, None),                       # nothing but None
+        ("  event ", "\tQ3-2025\n", " x "), # surrounding whitespace
+        ("a|b", "c"),                       # separator inside a part
+        (),
+    ]
+
+    for parts in test_cases:
+        ok = _id(*parts) == _reference_id(*parts)
+        status = "✓" if ok else "✗"
+        print(f"{status} _id{parts!r}")
+        assert ok
+
+    print()
+
+
+def test_claim_id():
+    """Test _claim_id against _id("claim", company_id, event_id, text.lower())."""
+    print("=" * 80)
+    print("Testing _claim_id")
+    print("=" * 80)
+
+    test_cases = [
+        # (label, text)
+        ("plain", "Revenue grew 12% year over year"),
+        ("surrounding whitespace", "  Revenue Grew 12%\n"),
+        ("empty", ""),
+        ("longer than 8 KB", "Data center revenue beat estimates. " * 400),
+        ("over 8 KB without spaces", "X" * 20000 + " tail"),
+        ("Greek final sigma, no spaces", "ÀΣ" * 5000),
+        ("Greek final sigma at a space", ("ΟΔΥΣΣΕΥΣ " * 1200).strip()),
+    ]
+
+    for label, text in test_cases:
+        for company_id, event_id in (("c1", "e1"), ("c1", "e1"), ("c2", "e1")):
+            expected = _reference_id("claim", company_id, event_id, text.lower())
+            ok = _claim_id(company_id, event_id, text) == expected
+            status = "✓" if ok else "✗"
+            print(f"{status} {label} ({company_id}/{event_id}, {len(text)} chars)")
+            assert ok
+
+    print()
+
+
+if __name__ == "__main__":
+    test_id()
+    test_claim_id()
+
+    print("=" * 80)
+    print("All ID Tests Complete!")
+    print("=" * 80)
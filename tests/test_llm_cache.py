@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-disk LLM claim extraction cache.
+
+Usage:
+    python3 tests/test_llm_cache.py
+
+    Or from project root:
+    python3 -m tests.test_llm_cache
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from extract import llm_claims
+from extract.contracts import SourceDoc
+from extract.schemas import ClaimsPayload
+
+
+class StubResponses:
+    """Stands in for client.responses; echoes the prompt's company back as a claim."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def parse(self, **kwargs):
+        self.calls += 1
+        prompt = kwargs["input"][1]["content"]
+        company = prompt.split("Company: ", 1)[1].split("\n", 1)[0]
+        payload = ClaimsPayload.model_validate({"claims": [{"text": f"{company} revenue up"}]})
+        return SimpleNamespace(output_parsed=payload)
+
+
+def _extract(client, doc, company_name, period):
+    return llm_claims.extract_claims_from_source_openai(
+        client=client, company_name=company_name, period=period, source=doc
+    )
+
+
+def test_llm_cache_keys():
+    """Test cache hits for repeats and misses for another company/period."""
+    print("=" * 80)
+    print("Testing LLM Cache Keys")
+    print("=" * 80)
+
+    llm_claims.LLM_CACHE_PATH = Path(tempfile.mkdtemp()) / "llm_claims.sqlite3"
+    responses = StubResponses()
+    client = SimpleNamespace(responses=responses)
+    doc = SourceDoc(
+        url="https://example.com/chip-earnings",
+        title="Chipmakers report",
+        raw_text="NVIDIA and AMD both reported quarterly revenue growth.",
+        source_type="news",
+        fetched_at=datetime.now(timezone.utc),
+    )
+
+    test_cases = [
+        # (company, period, expected total LLM calls, expected claim text)
+        ("NVIDIA", "Q3-2025", 1, "NVIDIA revenue up"),
+        ("NVIDIA", "Q3-2025", 1, "NVIDIA revenue up"),  # cache hit
+        ("AMD", "Q3-2025", 2, "AMD revenue up"),        # other company
+        ("NVIDIA", "Q2-2025", 3, "NVIDIA revenue up"),  # other period
+        ("AMD", "Q3-2025", 3, "AMD revenue up"),        # cache hit
+    ]
+
+    for company, period, expected_calls, expected_text in test_cases:
+        claims = _extract(client, doc, company, period)
+        ok = (
+            responses.calls == expected_calls
+            and claims[0].text == expected_text
+            and claims[0].company_name == company
+            and claims[0].period == period
+        )
+        status = "✓" if ok else "✗"
+        print(f"{status} {company}/{period} → {claims[0].text!r}, calls={responses.calls} (expected {expected_calls})")
+        assert ok
+
+    print()
+
+
+if __name__ == "__main__":
+    test_llm_cache_keys()
+
+    print("=" * 80)
+    print("All LLM Cache Tests Complete!")
+    print("=" * 80)